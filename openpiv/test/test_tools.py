@@ -1,6 +1,12 @@
-from openpiv.tools import imread, save, display_vector_field
+from openpiv.tools import (
+    imread, save, save_npy, display_vector_field, negative, Multiprocesser,
+    display_windows_sampling, _find_files, imsave
+)
 from openpiv.pyprocess import extended_search_area_piv, get_coordinates
+import multiprocessing
 import pathlib
+import sys
+import pytest
 import numpy as np
 import matplotlib.pyplot as plt
 from matplotlib.testing import compare
@@ -9,6 +15,7 @@ file_a = pathlib.Path(__file__).parent / '../examples/test1/exp1_001_a.bmp'
 file_b = pathlib.Path(__file__).parent / '../examples/test1/exp1_001_b.bmp'
 
 test_file = pathlib.Path(__file__).parent / 'test_tools.png'
+test_dir = pathlib.Path(__file__).parent / '../examples/test2'
 
 
 def test_imread(image_file=file_a):
@@ -18,6 +25,37 @@ def test_imread(image_file=file_a):
     assert a[-1, -1] == 15
 
 
+def test_negative(image_file=file_a):
+    a = imread(image_file)
+    b = negative(a)
+    assert b.dtype == np.uint8
+    assert b[0, 0] == 247
+    negative(a, out=a)
+    assert np.array_equal(a, b)
+
+
+def test_imsave(tmp_path):
+    # a wide signed range is shifted and scaled without overflow
+    a = np.array([[-30000, 0], [1000, 30000]], dtype=np.int16)
+    a_copy = a.copy()
+    imsave(str(tmp_path / 'a.tif'), a)
+    assert np.array_equal(a, a_copy)
+    b = imread(tmp_path / 'a.tif')
+    assert np.isclose(b.min(), 0) and np.isclose(b.max(), 255)
+    assert np.allclose(b, (a.astype(float) + 30000) * 255 / 60000)
+
+    a = np.array([[-1, 0], [64, 127]], dtype=np.int8)
+    imsave(str(tmp_path / 'a8.tif'), a)
+    assert np.allclose(imread(tmp_path / 'a8.tif'), a.astype(float) + 1)
+
+    # a float array above 255 is scaled to [0, 255]
+    a = np.array([[0.0, 100.0], [255.0, 510.0]])
+    a_copy = a.copy()
+    imsave(str(tmp_path / 'f.tif'), a)
+    assert np.array_equal(a, a_copy)
+    assert np.allclose(imread(tmp_path / 'f.tif'), a / 2)
+
+
 def test_display_vector_field(file_a=file_a, file_b=file_b):
     a = imread(file_a)
     b = imread(file_b)
@@ -42,3 +80,132 @@ def test_display_vector_field(file_a=file_a, file_b=file_b):
     fig.savefig('./tmp.png')
     res = compare.compare_images('./tmp.png', test_file, 0.001)
     assert res is None
+
+
+def test_save_fmt(tmp_path):
+    x, y = np.meshgrid(np.arange(4.0), np.arange(3.0))
+    fields = [x, y, x + 0.25, y - 0.5, np.ones_like(x), x > 2]
+    header = 'x\ty\tu\tv\ts2n\tmask'
+    for fmt in (['%.1f', '%.2f', '%6.3f', '%e', '%g', '%d'],
+                '%.2f %.2f %.2f %.2f %.2f %d',
+                '%8.4f'):
+        save(*fields, tmp_path / 'tmp.txt', fmt=fmt)
+        np.savetxt(tmp_path / 'ref.txt', np.column_stack(
+            [f.ravel() for f in fields]), fmt=fmt, delimiter='\t',
+            header=header)
+        assert (tmp_path / 'tmp.txt').read_bytes() == \
+            (tmp_path / 'ref.txt').read_bytes()
+
+    save(*fields, tmp_path / 'tmp.txt.gz')
+    assert np.array_equal(np.loadtxt(tmp_path / 'tmp.txt.gz'),
+                          np.loadtxt(tmp_path / 'ref.txt'))
+    with open(tmp_path / 'tmp.bin', 'wb') as f:
+        save(*fields, f)
+    assert (tmp_path / 'tmp.bin').read_bytes() == \
+        (tmp_path / 'ref.txt').read_bytes()
+
+    with pytest.raises(ValueError):
+        save(*fields, tmp_path / 'bad.txt', fmt='%.2f %.2f')
+    assert not (tmp_path / 'bad.txt').exists()
+
+
+def test_save_npy(tmp_path):
+    x, y = np.meshgrid(np.arange(4.0), np.arange(3.0))
+    u, v = x + 0.25, y - 0.5
+    mask = x > 2
+    save(x, y, u, v, np.ones_like(x), mask, tmp_path / 'tmp.txt')
+    save_npy(x, y, u, v, np.ones_like(x), mask, tmp_path / 'tmp.npy')
+    a = np.load(tmp_path / 'tmp.npy')
+    assert a.shape == (12, 6)
+    assert np.allclose(a, np.loadtxt(tmp_path / 'tmp.txt'))
+
+    # display_vector_field reads both files the same way
+    for name in ('tmp.txt', 'tmp.npy'):
+        fig, ax = display_vector_field(tmp_path / name)
+        invalid, valid = ax.collections
+        assert invalid.get_facecolor()[0, 0] == 1  # red
+        assert len(invalid.U) == 3 and len(valid.U) == 9
+        assert np.allclose(valid.X, x[~mask]) and np.allclose(valid.U, u[~mask])
+        plt.close(fig)
+
+
+def corner(image_pair):
+    file_a, file_b, counter = image_pair
+    return imread(file_a)[:4, :5] - imread(file_b)[:4, :5] + counter
+
+
+def test_multiprocesser_backend():
+    multi = Multiprocesser(test_dir, '2image_*0.tif', '2image_*1.tif')
+    counters = []
+
+    def record(image_pair):
+        corner(image_pair)
+        counters.append(image_pair[2])
+
+    assert multi.run(record, n_cpus=2, backend='thread') is None
+    assert sorted(counters) == list(range(multi.n_files))
+
+    with pytest.raises(ValueError):
+        multi.run(corner, n_cpus=2, backend='bogus')
+
+
+def test_multiprocesser_out_shape(monkeypatch):
+    multi = Multiprocesser(test_dir, '2image_*0.tif', '2image_*1.tif')
+    expected = np.stack([
+        corner((a, b, i))
+        for i, (a, b) in enumerate(zip(multi.files_a, multi.files_b))
+    ])
+    for backend in ('process', 'thread'):
+        out = multi.run(corner, n_cpus=2, backend=backend,
+                        out_shape=(4, 5), dtype=expected.dtype)
+        assert np.array_equal(out, expected)
+
+    # without multiprocessing.shared_memory (python < 3.8) the results
+    # are sent back to the main process
+    monkeypatch.delattr(multiprocessing, 'shared_memory', raising=False)
+    monkeypatch.setitem(sys.modules, 'multiprocessing.shared_memory', None)
+    out = multi.run(corner, n_cpus=2, out_shape=(4, 5), dtype=expected.dtype)
+    assert np.array_equal(out, expected)
+
+
+def test_display_windows_sampling():
+    window_size = 16
+    x, y = np.meshgrid(np.arange(7) * 16.0 + 8, np.arange(5) * 12.0 + 3)
+    for skip, method, n_windows in ((0, 'standard', 35), (1, 'standard', 18),
+                                    (2, 'standard', 13), (1, 'random', 17)):
+        display_windows_sampling(x, y, window_size, skip=skip, method=method)
+        ax = plt.gca()
+        paths = ax.collections[-1].get_paths()
+        assert len(paths) == n_windows
+        # the whole windows are in view, not only the window centers
+        corners = np.concatenate([path.vertices for path in paths])
+        xlim, ylim = ax.get_xlim(), ax.get_ylim()
+        assert xlim[0] <= corners[:, 0].min() and xlim[1] >= corners[:, 0].max()
+        assert ylim[0] <= corners[:, 1].min() and ylim[1] >= corners[:, 1].max()
+        plt.close('all')
+
+
+def test_find_files(tmp_path):
+    names = ['img_1_a.tif', 'img_1_b.tif', 'img_0_a.tif', 'img_0_b.tif',
+             '.img_2_a.tif', 'other.txt']
+    for name in names:
+        (tmp_path / name).touch()
+    (tmp_path / 'sub').mkdir()
+    (tmp_path / 'sub' / 'img_3_a.tif').touch()
+
+    # one listing shared by two patterns, sorted, hidden files skipped
+    files_a, files_b = _find_files(tmp_path, ['img_*_a.tif', 'img_*_b.tif'])
+    assert files_a == [str(tmp_path / 'img_0_a.tif'),
+                       str(tmp_path / 'img_1_a.tif')]
+    assert files_b == [str(tmp_path / 'img_0_b.tif'),
+                       str(tmp_path / 'img_1_b.tif')]
+    # a file can match both patterns, hidden files match explicit dots
+    assert _find_files(tmp_path, ['*_a.tif', '.*']) == [
+        files_a, [str(tmp_path / '.img_2_a.tif')]]
+    # patterns with a directory part
+    assert _find_files(tmp_path, ['sub/*.tif']) == [
+        [str(tmp_path / 'sub' / 'img_3_a.tif')]]
+    # a missing directory matches nothing
+    assert _find_files(tmp_path / 'missing', ['*', '*']) == [[], []]
+    with pytest.raises(ValueError):
+        Multiprocesser(tmp_path / 'missing', 'img_*_a.tif', 'img_*_b.tif')
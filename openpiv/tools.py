@@ -20,16 +20,18 @@ along with this program.  If not, see <http://www.gnu.org/licenses/>.
 """
 
 import glob
+import gzip
+import fnmatch
+import functools
+import re
 import sys
 import os.path
 import multiprocessing
+from multiprocessing.pool import ThreadPool
 
 import numpy as np
-import matplotlib.pyplot as plt
-import matplotlib.patches as pt
 
-# from builtins import range
-from imageio import imread as _imread, imsave as _imsave
+from imageio.v2 import imread as _imread, imwrite as _imsave
 
 
 def display_vector_field(
@@ -49,7 +51,8 @@ def display_vector_field(
     Parameters
     ----------
     filename :  string
-        the absolute path of the text file
+        the absolute path of the text file written by save, or of
+        the .npy file written by save_npy
 
     on_img : Bool, optional
         if True, display the vector field on top of the image provided by 
@@ -92,8 +95,16 @@ def display_vector_field(
                                           scale=100, width=0.0025)
     
     """
-
-    a = np.loadtxt(filename)
+    # matplotlib is imported here and not with the module, to keep
+    # tools light for the processing workers that do not display
+    import matplotlib.pyplot as plt
+
+    # read only the x, y, u, v and mask columns, skip sig2noise
+    columns = (0, 1, 2, 3, 5)
+    if str(filename).endswith(".npy"):
+        a = np.load(filename)[:, columns]
+    else:
+        a = np.loadtxt(filename, usecols=columns, dtype=np.float32)
     if ax is None:
         fig, ax = plt.subplots()
     else:
@@ -101,9 +112,8 @@ def display_vector_field(
 
     if on_img is True:  # plot a background image
         im = imread(image_name)
-        im = negative(im)  # plot negative of the image for more clarity
-        # imsave('neg.tif', im)
-        # im = imread('neg.tif')
+        # plot negative of the image for more clarity, reusing its buffer
+        negative(im, out=im)
         xmax = np.amax(a[:, 0]) + window_size / (2 * scaling_factor)
         ymax = np.amax(a[:, 1]) + window_size / (2 * scaling_factor)
         ax.imshow(im, origin="lower", cmap="Greys_r", extent=[0.0, xmax, 0.0, ymax])
@@ -112,14 +122,14 @@ def display_vector_field(
     if widim is True:
         a[:, 1] = a[:, 1].max() - a[:, 1]
 
-    invalid = a[:, 5].astype("bool")  # mask is now 5, sig2noise is 4
-    # fig.canvas.set_window_title('Vector field,
+    invalid = a[:, 4].astype("bool")  # mask is column 5 of the file
+    # fig.canvas.manager.set_window_title('Vector field,
     #       '+str(np.count_nonzero(invalid))+' wrong vectors')
-    valid = ~invalid
-    ax.quiver(
-        a[invalid, 0], a[invalid, 1], a[invalid, 2], a[invalid, 3], color="r", width=width, **kw
-    )
-    ax.quiver(a[valid, 0], a[valid, 1], a[valid, 2], a[valid, 3], color="b", width=width,**kw)
+    # gather the invalid and the valid rows once, not once per column
+    inv = a[invalid]
+    val = a[~invalid]
+    ax.quiver(inv[:, 0], inv[:, 1], inv[:, 2], inv[:, 3], color="r", width=width, **kw)
+    ax.quiver(val[:, 0], val[:, 1], val[:, 2], val[:, 3], color="b", width=width, **kw)
     #     if on_img is False:
     ax.invert_yaxis()
 
@@ -130,7 +140,7 @@ def display_vector_field(
 
 def imread(filename, flatten=0):
     """Read an image file into a numpy array
-    using imageio.imread
+    using imageio.v2.imread
     
     Parameters
     ----------
@@ -142,7 +152,8 @@ def imread(filename, flatten=0):
     Returns
     -------
     frame : np.ndarray
-        a numpy array with grey levels
+        a numpy array with grey levels, in the dtype of the file
+        (e.g. uint8) for greyscale images
         
         
     Examples
@@ -154,7 +165,7 @@ def imread(filename, flatten=0):
     
     
     """
-    im = _imread(filename)
+    im = np.asarray(_imread(filename))
     if np.ndim(im) > 2:
         im = rgb2gray(im)
 
@@ -167,7 +178,7 @@ def rgb2gray(rgb):
 
 def imsave(filename, arr):
     """Write an image file from a numpy array
-    using imageio.imread
+    using imageio.v2.imwrite
     
     Parameters
     ----------
@@ -188,12 +199,17 @@ def imsave(filename, arr):
     if np.ndim(arr) > 2:
         arr = rgb2gray(arr)
 
-    if np.amin(arr) < 0:
-        arr -= arr.min()
+    # compute each extreme once, without rescanning after the shift,
+    # and rescale a copy of the array only when the grey levels are
+    # outside [0, 255], in float so that narrow integer types such as
+    # int8 or int16 do not overflow
+    lo, hi = float(np.min(arr)), float(np.max(arr))
+    if lo < 0:
+        arr = np.subtract(arr, lo, dtype=np.float64)
+        hi = hi - lo
 
-    if np.amax(arr) > 255:
-        arr /= arr.max()
-        arr *= 255
+    if hi > 255:
+        arr = np.multiply(arr, 255.0 / hi, dtype=np.float64)
 
     if filename.endswith("tif"):
         _imsave(filename, arr, format="TIFF")
@@ -218,7 +234,7 @@ def mark_background(threshold, list_img, filename):
     mark = np.zeros(list_frame[0].shape, dtype=np.int32)
     background = np.zeros(list_frame[0].shape, dtype=np.int32)
     for I in range(mark.shape[0]):
-        print((" row ", I, " / ", mark.shape[0]))
+        print(" row ", I, " / ", mark.shape[0])
         for J in range(mark.shape[1]):
             sum1 = 0
             for K in range(len(list_frame)):
@@ -239,7 +255,7 @@ def mark_background2(list_img, filename):
         list_frame.append(imread(list_img[I]))
     background = np.zeros(list_frame[0].shape, dtype=np.int32)
     for I in range(background.shape[0]):
-        print((" row ", I, " / ", background.shape[0]))
+        print(" row ", I, " / ", background.shape[0])
         for J in range(background.shape[1]):
             min_1 = 255
             for K in range(len(list_frame)):
@@ -253,7 +269,9 @@ def mark_background2(list_img, filename):
 
 def edges(list_img, filename):
     back = mark_background(30, list_img, filename)
-    edges = filter.canny(back, sigma=3)
+    from skimage.feature import canny
+
+    edges = canny(back, sigma=3)
     imsave(filename, edges)
 
 
@@ -261,7 +279,7 @@ def find_reflexions(list_img, filename):
     background = mark_background2(list_img, filename)
     reflexion = np.zeros(background.shape, dtype=np.int32)
     for I in range(background.shape[0]):
-        print((" row ", I, " / ", background.shape[0]))
+        print(" row ", I, " / ", background.shape[0])
         for J in range(background.shape[1]):
             if background[I, J] > 253:
                 reflexion[I, J] = 255
@@ -275,15 +293,15 @@ def find_boundaries(threshold, list_img1, list_img2, filename, picname):
     print("mark1..")
     mark1 = mark_background(threshold, list_img1, "mark1.bmp")
     print("[DONE]")
-    print((mark1.shape))
+    print(mark1.shape)
     print("mark2..")
     mark2 = mark_background(threshold, list_img2, "mark2.bmp")
     print("[DONE]")
     print("computing boundary")
-    print((mark2.shape))
+    print(mark2.shape)
     list_bound = np.zeros(mark1.shape, dtype=np.int32)
     for I in range(list_bound.shape[0]):
-        print(("bound row ", I, " / ", mark1.shape[0]))
+        print("bound row ", I, " / ", mark1.shape[0])
         for J in range(list_bound.shape[1]):
             list_bound[I, J] = 0
             if mark1[I, J] == 0:
@@ -332,12 +350,14 @@ def save(x, y, u, v, sig2noise_ratio, mask, filename, fmt="%8.4f", delimiter="\t
         a two dimensional boolen array where elements corresponding to
         invalid vectors are True.
 
-    filename : string
-        the path of the file where to save the flow field
+    filename : string or file
+        the path of the file where to save the flow field, or an open
+        file object. A path ending in .gz is saved gzip-compressed.
 
     fmt : string
-        a format string. See documentation of numpy.savetxt
-        for more details.
+        a format string for one column or for all six columns, or a
+        sequence of six format strings. See documentation of
+        numpy.savetxt for more details.
 
     delimiter : string
         character separating columns
@@ -349,27 +369,93 @@ def save(x, y, u, v, sig2noise_ratio, mask, filename, fmt="%8.4f", delimiter="\t
                         delimiter='\t')
 
     """
-    # build output array
-    out = np.vstack([m.ravel() for m in [x, y, u, v, sig2noise_ratio, mask]])
-
-    # save data to file.
-    np.savetxt(
-        filename,
-        out.T,
-        fmt=fmt,
-        delimiter=delimiter,
-        header="x"
-        + delimiter
-        + "y"
-        + delimiter
-        + "u"
-        + delimiter
-        + "v"
-        + delimiter
-        + "s2n"
-        + delimiter
-        + "mask",
-    )
+    fields = [np.ravel(m) for m in [x, y, u, v, sig2noise_ratio, mask]]
+
+    # build the row format as numpy.savetxt does, before touching the file
+    if isinstance(fmt, str):
+        n_fmt_chars = fmt.count("%")
+        if n_fmt_chars == 1:
+            fmt = [fmt] * len(fields)
+        elif n_fmt_chars == len(fields):
+            fmt = [fmt]
+        else:
+            raise ValueError("fmt has wrong number of %% formats:  %s" % fmt)
+    elif len(fmt) != len(fields):
+        raise ValueError("fmt has wrong shape.  %s" % str(fmt))
+    row_fmt = delimiter.join(fmt) + "\n"
+
+    header = delimiter.join(["x", "y", "u", "v", "s2n", "mask"])
+
+    if hasattr(filename, "write"):
+        _write_rows(filename, header, fields, row_fmt)
+    elif os.fspath(filename).endswith(".gz"):
+        with gzip.open(filename, "wt") as f:
+            _write_rows(f, header, fields, row_fmt)
+    else:
+        # through a large buffer so that the body reaches the disk
+        # in a few big writes
+        with open(filename, "w", buffering=4 * 1024 * 1024) as f:
+            _write_rows(f, header, fields, row_fmt)
+
+
+def _write_rows(f, header, fields, row_fmt):
+    """Write the header and the rows of the flat fields to the file
+    object f, text or binary, in the layout of numpy.savetxt."""
+    write = f.write
+    try:
+        write("")
+    except TypeError:
+        # binary file, encoded as numpy.savetxt does
+        def write(text):
+            f.write(text.encode("latin1"))
+
+    write("# " + header + "\n")
+
+    # format the rows with a single % expression each, on the
+    # python floats of the columns, instead of the per-row loop
+    # of numpy.savetxt. The rows are stacked and formatted by
+    # blocks, to bound the memory used for large fields.
+    block = 1 << 16
+    for start in range(0, fields[0].size, block):
+        out = _stack_fields(*[m[start : start + block] for m in fields])
+        columns = [column.tolist() for column in out.T]
+        write("".join([row_fmt % row for row in zip(*columns)]))
+
+
+def save_npy(x, y, u, v, sig2noise_ratio, mask, filename):
+    """Save flow field to a binary numpy .npy file.
+
+    The file holds the same (N, 6) array of x, y, u, v, s2n, mask
+    columns as the ascii file written by save, and is much faster
+    to write and to read back, e.g. by display_vector_field.
+
+    Parameters
+    ----------
+    x, y, u, v, sig2noise_ratio, mask : 2d np.ndarray
+        see save
+
+    filename : string
+        the path of the file where to save the flow field, numpy
+        appends the .npy extension if it is missing
+
+    Examples
+    --------
+
+    openpiv.tools.save_npy( x, y, u, v, sig2noise, mask, 'field_001.npy')
+
+    """
+    np.save(filename, _stack_fields(x, y, u, v, sig2noise_ratio, mask))
+
+
+def _stack_fields(x, y, u, v, sig2noise_ratio, mask):
+    """Return the fields as the columns of an (N, 6) float array."""
+    # fill the columns of a preallocated array, without
+    # a temporary list and a transposed copy
+    fields = [x, y, u, v, sig2noise_ratio, mask]
+    out = np.empty((np.size(x), len(fields)), dtype=np.float64)
+    for i, m in enumerate(fields):
+        out[:, i] = np.ravel(m)
+    return out
 
 
 def display(message):
@@ -420,17 +506,12 @@ class Multiprocesser:
         """
         # load lists of images
 
-        self.files_a = sorted(
-            glob.glob(os.path.join(os.path.abspath(data_dir), pattern_a))
-        )
-
         if pattern_b is None:
+            (self.files_a,) = _find_files(data_dir, [pattern_a])
             self.files_b = self.files_a[1:]
             self.files_a = self.files_a[:-1]
         else:
-            self.files_b = sorted(
-                glob.glob(os.path.join(os.path.abspath(data_dir), pattern_b))
-            )
+            self.files_a, self.files_b = _find_files(data_dir, [pattern_a, pattern_b])
 
         # number of images
         self.n_files = len(self.files_a)
@@ -446,7 +527,7 @@ class Multiprocesser:
                 "Something failed loading the image file. No images were found. Please check directory and image template name."
             )
 
-    def run(self, func, n_cpus=1):
+    def run(self, func, n_cpus=1, backend="process", out_shape=None, dtype=np.float64):
         """Start to process images.
         
         Parameters
@@ -456,42 +537,204 @@ class Multiprocesser:
             image pair. See tutorial for more details.
         
         n_cpus : int
-            the number of processes to launch in parallel.
+            the number of processes (or threads) to launch in parallel.
             For debugging purposes use n_cpus=1
+
+        backend : str, optional
+            can be only <process> (default, a pool of processes) or
+            <thread> (a pool of threads). Threads avoid starting and
+            pickling to new processes and suit func dominated by
+            reading images from disk; processes are better when func
+            spends its time computing in Python.
+
+        out_shape : tuple, optional
+            the shape of the array returned by func for each image
+            pair, e.g. (3, ny, nx) for u, v and mask. If given, the
+            results are collected in a single array, which the worker
+            processes fill through shared memory instead of sending
+            back each result (on python >= 3.8, before that the
+            results are sent back).
+
+        dtype : np.dtype, optional
+            the dtype of the collected results, used with out_shape
+
+        Returns
+        -------
+        out : np.ndarray or None
+            if out_shape is given, an array of shape 
+            (n_files,) + out_shape with the result of func for the 
+            i-th image pair in out[i], otherwise None
         
         """
+        if backend not in ("process", "thread"):
+            raise ValueError("backend not valid: choose between process and thread")
 
-        # create a list of tasks to be executed.
-        image_pairs = [
+        # create a stream of tasks to be executed.
+        image_pairs = (
             (file_a, file_b, i)
-            for file_a, file_b, i in zip(
-                self.files_a, self.files_b, range(self.n_files)
-            )
-        ]
+            for i, (file_a, file_b) in enumerate(zip(self.files_a, self.files_b))
+        )
 
+        if out_shape is None:
+            self._map(func, image_pairs, n_cpus, backend)
+            return None
+
+        shape = (self.n_files,) + tuple(out_shape)
+
+        if backend == "thread" or n_cpus <= 1 or self.n_files <= 1:
+            # all the tasks run in this process, write straight to the output
+            out = np.empty(shape, dtype=dtype)
+
+            def store(image_pair):
+                out[image_pair[2]] = func(image_pair)
+
+            self._map(store, image_pairs, n_cpus, backend)
+            return out
+
+        try:
+            from multiprocessing import shared_memory
+        except ImportError:  # python < 3.8
+            # the results are sent back to this process and stored here
+            out = np.empty(shape, dtype=dtype)
+            indexed = functools.partial(_with_index, func)
+            for i, result in self._imap(indexed, image_pairs, n_cpus, backend):
+                out[i] = result
+            return out
+
+        # the worker processes write their results into a shared block
+        # of memory, which is copied once at the end
+        nbytes = int(np.prod(shape)) * np.dtype(dtype).itemsize
+        shm = shared_memory.SharedMemory(create=True, size=max(1, nbytes))
+        try:
+            store = functools.partial(_store_result, func, shm.name, shape, dtype)
+            self._map(store, image_pairs, n_cpus, backend)
+            out = np.ndarray(shape, dtype=dtype, buffer=shm.buf).copy()
+        finally:
+            shm.close()
+            shm.unlink()
+        return out
+
+    def _map(self, func, image_pairs, n_cpus, backend):
+        """Call func on each image pair, in parallel if possible."""
+        for _ in self._imap(func, image_pairs, n_cpus, backend):
+            pass
+
+    def _imap(self, func, image_pairs, n_cpus, backend):
+        """Yield func of each image pair, in any order, computed in
+        parallel if possible."""
         # for debugging purposes always use n_cpus = 1,
         # since it is difficult to debug multiprocessing stuff.
-        if n_cpus > 1:
-            pool = multiprocessing.Pool(processes=n_cpus)
-            res = pool.map(func, image_pairs)
-        else:
+        # A single image pair does not pay for starting a pool either.
+        if n_cpus <= 1 or self.n_files <= 1:
             for image_pair in image_pairs:
-                func(image_pair)
+                yield func(image_pair)
+            return
+
+        # send the tasks in chunks to amortize the communication
+        # with the workers, and consume the results as they come
+        chunksize = max(1, self.n_files // (4 * n_cpus))
+        if backend == "thread":
+            pool = ThreadPool(processes=n_cpus)
+        else:
+            pool = multiprocessing.Pool(processes=n_cpus)
+        with pool:
+            yield from pool.imap_unordered(func, image_pairs, chunksize)
+
+
+def _store_result(func, name, shape, dtype, image_pair):
+    """Write func(image_pair) into the shared memory block name, seen
+    as an array of the given shape and dtype, at the index of the pair.
+    """
+    from multiprocessing import shared_memory
 
+    shm = shared_memory.SharedMemory(name=name)
+    try:
+        out = np.ndarray(shape, dtype=dtype, buffer=shm.buf)
+        out[image_pair[2]] = func(image_pair)
+        del out
+    finally:
+        shm.close()
 
-def negative(image):
+
+def _with_index(func, image_pair):
+    """Return the index of image_pair with func(image_pair)."""
+    return image_pair[2], func(image_pair)
+
+
+def _find_files(data_dir, patterns):
+    """Return, for each shell glob pattern, the sorted list of the
+    paths in data_dir that match it.
+
+    The directory is listed once for all the patterns, instead of
+    once per pattern with glob.glob. Patterns that contain a
+    directory part are passed to glob.glob.
+    """
+    data_dir = os.path.abspath(data_dir)
+    # as glob, a missing directory matches nothing
+    if not os.path.isdir(data_dir):
+        return [[] for _ in patterns]
+    if any(os.path.dirname(pattern) for pattern in patterns):
+        return [
+            sorted(glob.glob(os.path.join(data_dir, pattern))) for pattern in patterns
+        ]
+
+    regexes = [
+        re.compile(fnmatch.translate(os.path.normcase(pattern))) for pattern in patterns
+    ]
+    files = [[] for _ in patterns]
+    with os.scandir(data_dir) as entries:
+        for entry in entries:
+            name = os.path.normcase(entry.name)
+            for pattern, regex, matched in zip(patterns, regexes, files):
+                # as glob, wildcards do not match hidden files
+                if name.startswith(".") and not pattern.startswith("."):
+                    continue
+                if regex.match(name):
+                    matched.append(os.path.join(data_dir, entry.name))
+
+    return [sorted(matched) for matched in files]
+
+
+def negative(image, out=None):
     """ Return the negative of an image
     
     Parameter
     ----------
     image : 2d np.ndarray of grey levels
 
+    out : 2d np.ndarray, optional
+        array where the result is stored, e.g. image itself to compute
+        the negative in place. By default a new array is allocated.
+
     Returns
     -------
-    (255-image) : 2d np.ndarray of grey levels
+    (255-image) : 2d np.ndarray of grey levels, of the same dtype
+        as image (uint8 images stay uint8)
+
+    Notes
+    -----
+    Each per-pixel step of a preprocessing chain walks the whole image.
+    Passing out lets the steps reuse one buffer instead of allocating a
+    new image each; when profiling shows such a chain as a hot spot,
+    the steps can be fused into a single pass, e.g. with a numba kernel
+    computing max(255 - image - background, 0) pixel by pixel.
+
+    Unsigned arithmetic wraps around: subtracting a background from the
+    uint8 images of imread in place turns negative values into values
+    close to 255. Chain such steps in a signed (or float) buffer and
+    clip the result, as in the example below.
+
+    Examples
+    --------
+
+    >>> frame = openpiv.tools.imread('image.bmp').astype(np.int16)
+    >>> background = openpiv.tools.imread('background.bmp')
+    >>> openpiv.tools.negative(frame, out=frame)
+    >>> np.subtract(frame, background, out=frame)
+    >>> np.clip(frame, 0, 255, out=frame)
 
     """
-    return 255 - image
+    return np.subtract(255, image, out=out)
 
 
 def display_windows_sampling(x, y, window_size, skip=0, method="standard"):
@@ -524,65 +767,50 @@ def display_windows_sampling(x, y, window_size, skip=0, method="standard"):
 
     
     """
+    import matplotlib.pyplot as plt
+    import matplotlib.patches as pt
+    from matplotlib.collections import PatchCollection
 
     fig = plt.figure()
     if skip < 0 or skip + 1 > len(x[0]) * len(y):
-        fig.canvas.set_window_title("interrogation points map")
+        fig.canvas.manager.set_window_title("interrogation points map")
         plt.scatter(x, y, color="g")  # plot interrogation locations
     else:
-        nb_windows = len(x[0]) * len(y) / (skip + 1)
+        nb_windows = len(x[0]) * len(y) // (skip + 1)
         # standard method --> display uniformly picked windows
         if method == "standard":
             plt.scatter(x, y, color="g")  # plot interrogation locations (green dots)
-            fig.canvas.set_window_title("interrogation window map")
-            # plot the windows as red squares
-            for i in range(len(x[0])):
-                for j in range(len(y)):
-                    if j % 2 == 0:
-                        if i % (skip + 1) == 0:
-                            x1 = x[0][i] - window_size / 2
-                            y1 = y[j][0] - window_size / 2
-                            plt.gca().add_patch(
-                                pt.Rectangle(
-                                    (x1, y1),
-                                    window_size,
-                                    window_size,
-                                    facecolor="r",
-                                    alpha=0.5,
-                                )
-                            )
-                    else:
-                        if i % (skip + 1) == 1 or skip == 0:
-                            x1 = x[0][i] - window_size / 2
-                            y1 = y[j][0] - window_size / 2
-                            plt.gca().add_patch(
-                                pt.Rectangle(
-                                    (x1, y1),
-                                    window_size,
-                                    window_size,
-                                    facecolor="r",
-                                    alpha=0.5,
-                                )
-                            )
+            fig.canvas.manager.set_window_title("interrogation window map")
+            # plot the windows as red squares, every (skip + 1) column,
+            # shifted by one column on odd rows
+            i, j = np.meshgrid(
+                np.arange(len(x[0])), np.arange(len(y)), indexing="ij"
+            )
+            selected = np.where(
+                j % 2 == 0, i % (skip + 1) == 0, (i % (skip + 1) == 1) | (skip == 0)
+            )
+            k, l = i[selected], j[selected]
         # random method --> display randomly picked windows
         elif method == "random":
             plt.scatter(x, y, color="g")  # plot interrogation locations
-            fig.canvas.set_window_title(
+            fig.canvas.manager.set_window_title(
                 "interrogation window map, showing randomly "
                 + str(nb_windows)
                 + " windows"
             )
-            for i in range(nb_windows):
-                k = np.random.randint(len(x[0]))  # pick a row and column index
-                l = np.random.randint(len(y))
-                x1 = x[0][k] - window_size / 2
-                y1 = y[l][0] - window_size / 2
-                plt.gca().add_patch(
-                    pt.Rectangle(
-                        (x1, y1), window_size, window_size, facecolor="r", alpha=0.5
-                    )
-                )
+            # pick the row and column indices
+            k = np.random.randint(len(x[0]), size=nb_windows)
+            l = np.random.randint(len(y), size=nb_windows)
         else:
             raise ValueError("method not valid: choose between standard and random")
+        x1 = np.asarray(x)[0, k] - window_size / 2
+        y1 = np.asarray(y)[l, 0] - window_size / 2
+        rects = [
+            pt.Rectangle(corner, window_size, window_size) for corner in zip(x1, y1)
+        ]
+        # add all the windows to the axes at once
+        plt.gca().add_collection(PatchCollection(rects, facecolor="r", alpha=0.5))
+        # unlike add_patch, add_collection does not update the view limits
+        plt.gca().autoscale_view()
     plt.draw()
     plt.show()
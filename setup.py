@@ -35,7 +35,7 @@ setup(
     install_requires=[
         'cython>=0.29.14',
         'numpy',
-        'imageio',
+        'imageio>=2.16',
         'matplotlib>=3',
         'scikit-image',
         'scipy',